@@ -12,6 +12,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 
 from django.conf import settings
+from django.core.cache import cache
 from apps.users.models import User
 from apps.profiles.models import (
     UserProfile,
@@ -25,6 +26,16 @@ from apps.profiles.models import (
 from .models import Job, JobEligibilityAnalysis
 
 
+def user_context_cache_key(user_id) -> str:
+    """Cache key for a user's gathered analysis context"""
+    return f"userctx:{user_id}"
+
+
+def job_context_cache_key(job_id) -> str:
+    """Cache key for a job's gathered analysis context"""
+    return f"jobctx:{job_id}"
+
+
 class DreamJobParser:
     """
     Service for parsing dream job descriptions using GPT-4
@@ -218,6 +229,11 @@ class JobEligibilityAnalyzer:
     LangChain-based service for analyzing user eligibility for job postings
     """
 
+    # Seconds a gathered user/job context is reused across requests. The
+    # default cache is per-process, so this is also the longest a context can
+    # stay stale after a write made in another process (e.g. a management command)
+    CONTEXT_CACHE_TIMEOUT = 60
+
     def __init__(self, model_name: str = None):
         """
         Initialize the analyzer with specified LLM model
@@ -381,6 +397,48 @@ class JobEligibilityAnalyzer:
 
         return context
 
+    def _get_user_context(self, user: User) -> Dict[str, Any]:
+        """
+        Get user context, reusing a recently gathered copy when possible
+
+        The cached copy is deleted whenever the user, their profile or any
+        record the context is built from changes in this process (see
+        apps.jobs.signals); other processes rely on CONTEXT_CACHE_TIMEOUT.
+
+        Args:
+            user: User instance
+
+        Returns:
+            Dictionary containing user profile, skills, experience, etc.
+        """
+        return cache.get_or_set(
+            user_context_cache_key(user.id),
+            lambda: self._gather_user_context(user),
+            self.CONTEXT_CACHE_TIMEOUT,
+        )
+
+    def _get_job_context(self, job: Job) -> Dict[str, Any]:
+        """
+        Get job context, reusing a recently gathered copy when possible
+
+        The cached copy is deleted whenever the job or its skill requirements
+        change in this process (see apps.jobs.signals); other processes rely
+        on CONTEXT_CACHE_TIMEOUT.
+
+        Args:
+            job: Job instance (temporary unsaved jobs are never cached)
+
+        Returns:
+            Dictionary containing job details, requirements, etc.
+        """
+        if job.pk is None:
+            return self._gather_job_context(job)
+        return cache.get_or_set(
+            job_context_cache_key(job.id),
+            lambda: self._gather_job_context(job),
+            self.CONTEXT_CACHE_TIMEOUT,
+        )
+
     def _gather_job_context(self, job: Job) -> Dict[str, Any]:
         """
         Gather comprehensive job context for analysis
@@ -614,8 +672,8 @@ Return ONLY the JSON object, no additional text.
             JobEligibilityAnalysis instance with analysis results
         """
         # Gather context
-        user_context = self._gather_user_context(user)
-        job_context = self._gather_job_context(job)
+        user_context = self._get_user_context(user)
+        job_context = self._get_job_context(job)
 
         # Create prompt
         prompt = self._create_prompt(user_context, job_context, additional_context)
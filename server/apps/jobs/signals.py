@@ -0,0 +1,77 @@
+"""
+Signal handlers that drop cached analysis contexts when their source data changes
+
+Only the cache of the process that made the write is cleared, since no shared
+CACHES backend is configured; writes from other processes are picked up once
+JobEligibilityAnalyzer.CONTEXT_CACHE_TIMEOUT expires.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.users.models import User, UserPreference
+from apps.profiles.models import (
+    UserProfile,
+    WorkExperience,
+    Education,
+    Certification,
+    UserSkill,
+)
+from .models import Job, JobSkillRequirement
+from .services import job_context_cache_key, user_context_cache_key
+
+
+def _drop(key: str):
+    # Wait for the commit so a concurrent request cannot re-cache old rows
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def _invalidate_profile_owner(profile):
+    _drop(user_context_cache_key(profile.user_id))
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_context(sender, instance, **kwargs):
+    _drop(user_context_cache_key(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=UserProfile)
+@receiver([post_save, post_delete], sender=UserPreference)
+def invalidate_user_context_for_owner(sender, instance, **kwargs):
+    _drop(user_context_cache_key(instance.user_id))
+
+
+@receiver([post_save, post_delete], sender=UserSkill)
+@receiver([post_save, post_delete], sender=WorkExperience)
+@receiver([post_save, post_delete], sender=Education)
+@receiver([post_save, post_delete], sender=Certification)
+def invalidate_user_context_for_record(sender, instance, **kwargs):
+    try:
+        _invalidate_profile_owner(instance.profile)
+    except UserProfile.DoesNotExist:
+        # Profile already deleted; its own handler cleared the key
+        pass
+
+
+@receiver(m2m_changed, sender=WorkExperience.skills_used.through)
+@receiver(m2m_changed, sender=Certification.skills_validated.through)
+def invalidate_user_context_for_skill_links(sender, instance, action, reverse, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        # Edited from the Skill side (admin-only catalog changes); those
+        # contexts fall back on CONTEXT_CACHE_TIMEOUT
+        return
+    _invalidate_profile_owner(instance.profile)
+
+
+@receiver([post_save, post_delete], sender=Job)
+def invalidate_job_context(sender, instance, **kwargs):
+    _drop(job_context_cache_key(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=JobSkillRequirement)
+def invalidate_job_context_for_requirement(sender, instance, **kwargs):
+    _drop(job_context_cache_key(instance.job_id))
@@ -2,11 +2,16 @@
 Streaming services for job analysis with real-time updates
 """
 
+import asyncio
 import json
 import os
-from typing import Dict, Any, Generator, Optional
+import re
+import time
+from typing import Dict, Any, AsyncGenerator, Generator, List, Optional
 from decimal import Decimal
 
+import orjson
+from asgiref.sync import sync_to_async
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
@@ -16,6 +21,228 @@ from .models import Job, JobEligibilityAnalysis
 from .services import JobEligibilityAnalyzer
 
 
+# Matches patterns like "field_name": 85 for the score fields we surface early
+_PARTIAL_METRICS_RE = re.compile(
+    r'"(match_score|skills_match_score|experience_match_score'
+    r'|technical_skills_score|readiness_percentage)"\s*:\s*(\d+)'
+)
+
+# Characters of already-scanned text kept so a field split across chunks still matches
+_SCAN_OVERLAP = 128
+
+# Fields reported in the 'metrics_complete' event
+METRIC_FIELDS = [
+    'match_score',
+    'skills_match_score',
+    'experience_match_score',
+    'education_match_score',
+    'culture_fit_score',
+    'location_match_score',
+    'salary_match_score',
+    'technical_skills_score',
+    'soft_skills_score',
+    'domain_knowledge_score',
+    'readiness_percentage',
+    'eligibility_level',
+]
+
+
+VALID_CONFIDENCE_LEVELS = {"VERY_HIGH", "HIGH", "MEDIUM", "LOW", "VERY_LOW"}
+
+
+def _to_decimal(value, default=None):
+    """Safely convert to Decimal"""
+    if value and value != "null":
+        try:
+            return Decimal(str(value))
+        except:
+            return default
+    return default
+
+
+def _to_int(value, default=0):
+    """Safely convert to int with default"""
+    if value is not None and value != "null":
+        try:
+            return int(value)
+        except:
+            return default
+    return default
+
+
+def _ensure_list(value, default=()):
+    """Ensure lists are properly formatted"""
+    # Fast path: the LLM almost always returns a real JSON array
+    if type(value) is list:
+        return value
+    if not value:
+        return list(default)
+    if isinstance(value, str):
+        try:
+            parsed = orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return [value]
+        return parsed if isinstance(parsed, list) else [value]
+    return list(default)
+
+
+def _to_text(value, default=""):
+    """Pass through a value, falling back to default when missing"""
+    return default if value is None else value
+
+
+def _to_confidence(value, default="MEDIUM"):
+    """Validate a confidence level"""
+    return value if value in VALID_CONFIDENCE_LEVELS else default
+
+
+# (field name, coercion function, default) for every analysis field taken
+# from the LLM result
+ANALYSIS_FIELD_SCHEMA = (
+    # Core analysis
+    ('eligibility_level', _to_text, "FAIR"),
+    ('match_score', _to_int, 50),
+    ('analysis_summary', _to_text, ""),
+    ('strengths', _ensure_list, ()),
+    ('gaps', _ensure_list, ()),
+    ('recommendations', _ensure_list, ()),
+    # Skills analysis
+    ('matching_skills', _ensure_list, ()),
+    ('missing_skills', _ensure_list, ()),
+    ('skill_gaps', _ensure_list, ()),
+    # Detailed match metrics
+    ('skills_match_score', _to_int, 0),
+    ('experience_match_score', _to_int, 0),
+    ('education_match_score', _to_int, 0),
+    ('culture_fit_score', _to_int, 0),
+    ('location_match_score', _to_int, 0),
+    ('salary_match_score', _to_int, 0),
+    # Categorized scores
+    ('technical_skills_score', _to_int, 0),
+    ('soft_skills_score', _to_int, 0),
+    ('domain_knowledge_score', _to_int, 0),
+    # Experience details
+    ('experience_match', _to_text, ""),
+    ('experience_gap_years', _to_decimal, None),
+    ('years_of_experience_required', _to_decimal, None),
+    ('years_of_experience_user', _to_decimal, None),
+    # Readiness metrics
+    ('readiness_percentage', _to_int, 0),
+    ('estimated_preparation_time', _to_text, ""),
+    ('confidence_level', _to_confidence, "MEDIUM"),
+    # Next steps & actionability
+    ('next_steps', _ensure_list, ()),
+    ('priority_improvements', _ensure_list, ()),
+    ('learning_resources', _ensure_list, ()),
+    # Interview preparation
+    ('interview_questions', _ensure_list, ()),
+)
+
+
+def _status_event(step: str, message: str, progress: int) -> Dict[str, Any]:
+    """Build a 'status' progress event"""
+    return {
+        'type': 'status',
+        'step': step,
+        'message': message,
+        'progress': progress
+    }
+
+
+class _StreamBuffer:
+    """
+    Collects streamed LLM chunks and turns them into progress events
+    """
+
+    def __init__(self, analyzer: "StreamingJobAnalyzer"):
+        self.analyzer = analyzer
+        self.parts: List[str] = []
+        self.buf: List[str] = []
+        self.batch_size = analyzer.min_batch_size
+        self.last_flush = time.monotonic()
+        self.chunk_count = 0
+        self.acc_len = 0
+
+        # Partial metrics are scanned incrementally: only chunks after
+        # scan_index, prefixed by the tail of the previous scan window
+        self.metrics: Dict[str, int] = {}
+        self.scan_index = 0
+        self.scan_tail = ''
+
+    @property
+    def content(self) -> str:
+        """Full response received so far"""
+        return ''.join(self.parts)
+
+    def feed(self, chunk) -> List[Dict[str, Any]]:
+        """
+        Add one LLM chunk
+
+        Returns:
+            Events to emit for this chunk (possibly none)
+        """
+        events = []
+        self.chunk_count += 1
+        content = chunk.content if hasattr(chunk, 'content') else str(chunk)
+        self.parts.append(content)
+        self.buf.append(content)
+        self.acc_len += len(content)
+
+        # Emit buffered content once the batch fills up or the deadline passes
+        now = time.monotonic()
+        if (
+            len(self.buf) >= self.batch_size
+            or (now - self.last_flush) > self.analyzer.flush_interval
+        ):
+            events.extend(self.flush())
+            self.last_flush = now
+            self.batch_size = min(
+                self.batch_size * self.analyzer.batch_growth,
+                self.analyzer.max_batch_size,
+            )
+
+        # Report partial metrics found so far
+        if self.chunk_count % 20 == 0:
+            self._scan_metrics()
+            if self.metrics:
+                events.append({
+                    'type': 'partial_metric',
+                    'metrics': dict(self.metrics),
+                    'progress': min(40 + (self.chunk_count // 20) * 5, 85)
+                })
+
+        return events
+
+    def _scan_metrics(self):
+        """Scan text received since the last scan for score fields"""
+        window = self.scan_tail + ''.join(self.parts[self.scan_index:])
+        self.scan_index = len(self.parts)
+        self.scan_tail = window[-_SCAN_OVERLAP:]
+
+        found = self.analyzer._extract_partial_metrics(window)
+        if found:
+            for field, value in found.items():
+                self.metrics.setdefault(field, value)
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Emit whatever is left in the buffer
+
+        Returns:
+            A single 'partial_analysis' event, or nothing if the buffer is empty
+        """
+        if not self.buf:
+            return []
+        event = {
+            'type': 'partial_analysis',
+            'content': ''.join(self.buf),
+            'accumulated_length': self.acc_len,
+            'progress': min(30 + (self.chunk_count // 10), 80)
+        }
+        self.buf.clear()
+        return [event]
+
+
 class StreamingJobAnalyzer(JobEligibilityAnalyzer):
     """
     Extended analyzer that supports streaming responses with progressive metrics
@@ -25,6 +252,17 @@ class StreamingJobAnalyzer(JobEligibilityAnalyzer):
         """Initialize with streaming support"""
         super().__init__(model_name)
 
+        # Partial content is flushed in batches that grow exponentially
+        # (1 -> 3 -> 9 -> 27 -> 50 chunks), or after flush_interval seconds,
+        # whichever comes first
+        self.min_batch_size = 1
+        self.batch_growth = 3
+        self.max_batch_size = 50
+        self.flush_interval = 0.08
+
+        # Events buffered between the LLM producer and a slow SSE client
+        self.sse_queue_size = 32
+
     def stream_analyze_eligibility(
         self,
         user: User,
@@ -47,225 +285,278 @@ class StreamingJobAnalyzer(JobEligibilityAnalyzer):
         Returns:
             Final JobEligibilityAnalysis instance
         """
-        # Step 1: Emit gathering context status
-        yield {
-            'type': 'status',
-            'step': 'gathering_context',
-            'message': 'Gathering your profile information...',
-            'progress': 10
-        }
+        # Step 1: Gather context
+        yield _status_event('gathering_context', 'Gathering your profile information...', 10)
 
-        # Gather context
-        user_context = self._gather_user_context(user)
-        job_context = self._gather_job_context(job)
+        user_context = self._get_user_context(user)
+        job_context = self._get_job_context(job)
 
-        yield {
-            'type': 'status',
-            'step': 'context_gathered',
-            'message': f'Analyzed {len(user_context.get("skills", []))} skills and {len(user_context.get("work_experience", []))} work experiences',
-            'progress': 20
-        }
+        yield self._context_gathered_event(user_context)
 
         # Step 2: Create prompt
-        yield {
-            'type': 'status',
-            'step': 'analyzing',
-            'message': 'AI is analyzing your fit for this role...',
-            'progress': 30
-        }
+        yield _status_event('analyzing', 'AI is analyzing your fit for this role...', 30)
 
         prompt = self._create_prompt(user_context, job_context, additional_context)
 
-        # Step 3: Stream LLM response
-        accumulated_content = ""
-        chunk_count = 0
-
         try:
-            # Use streaming invoke
+            # Step 3: Stream LLM response
+            stream_buffer = _StreamBuffer(self)
             for chunk in self.llm.stream(prompt):
-                chunk_count += 1
-                content = chunk.content if hasattr(chunk, 'content') else str(chunk)
-                accumulated_content += content
-
-                # Emit partial content every 10 chunks
-                if chunk_count % 10 == 0:
-                    progress = min(30 + (chunk_count // 10), 80)
-                    yield {
-                        'type': 'partial_analysis',
-                        'content': content,
-                        'accumulated_length': len(accumulated_content),
-                        'progress': progress
-                    }
-
-                # Try to parse partial JSON for metrics
-                if chunk_count % 20 == 0:
-                    try:
-                        partial_metrics = self._extract_partial_metrics(accumulated_content)
-                        if partial_metrics:
-                            yield {
-                                'type': 'partial_metric',
-                                'metrics': partial_metrics,
-                                'progress': min(40 + (chunk_count // 20) * 5, 85)
-                            }
-                    except:
-                        pass
+                yield from stream_buffer.feed(chunk)
+            yield from stream_buffer.flush()
 
             # Step 4: Process complete response
-            yield {
-                'type': 'status',
-                'step': 'processing',
-                'message': 'Processing analysis results...',
-                'progress': 90
-            }
-
-            # Parse final JSON response
-            try:
-                start_idx = accumulated_content.find("{")
-                end_idx = accumulated_content.rfind("}") + 1
-                if start_idx != -1 and end_idx > start_idx:
-                    json_str = accumulated_content[start_idx:end_idx]
-                    result = json.loads(json_str)
-                else:
-                    raise ValueError("No JSON found in response")
-            except Exception as e:
-                result = {
-                    "eligibility_level": "FAIR",
-                    "match_score": 50,
-                    "analysis_summary": f"Analysis could not be parsed properly.",
-                    "strengths": [],
-                    "gaps": [],
-                    "recommendations": [],
-                    "matching_skills": [],
-                    "missing_skills": [],
-                    "experience_match": "Unable to parse experience match",
-                }
-
-            # Helper functions (reused from parent class)
-            def to_decimal(value):
-                if value and value != "null":
-                    try:
-                        return Decimal(str(value))
-                    except:
-                        return None
-                return None
-
-            def to_int(value, default=0):
-                if value is not None and value != "null":
-                    try:
-                        return int(value)
-                    except:
-                        return default
-                return default
-
-            def ensure_list(value):
-                if isinstance(value, list):
-                    return value
-                elif isinstance(value, str):
-                    try:
-                        parsed = json.loads(value)
-                        return parsed if isinstance(parsed, list) else [value]
-                    except:
-                        return [value] if value else []
-                return []
-
-            # Extract all metrics
-            exp_gap = to_decimal(result.get("experience_gap_years"))
-            years_required = to_decimal(result.get("years_of_experience_required"))
-            years_user = to_decimal(result.get("years_of_experience_user"))
-
-            skills_match_score = to_int(result.get("skills_match_score"), 0)
-            experience_match_score = to_int(result.get("experience_match_score"), 0)
-            education_match_score = to_int(result.get("education_match_score"), 0)
-            culture_fit_score = to_int(result.get("culture_fit_score"), 0)
-            location_match_score = to_int(result.get("location_match_score"), 0)
-            salary_match_score = to_int(result.get("salary_match_score"), 0)
-            technical_skills_score = to_int(result.get("technical_skills_score"), 0)
-            soft_skills_score = to_int(result.get("soft_skills_score"), 0)
-            domain_knowledge_score = to_int(result.get("domain_knowledge_score"), 0)
-            readiness_percentage = to_int(result.get("readiness_percentage"), 0)
-
-            confidence_level = result.get("confidence_level", "MEDIUM")
-            valid_confidence = ["VERY_HIGH", "HIGH", "MEDIUM", "LOW", "VERY_LOW"]
-            if confidence_level not in valid_confidence:
-                confidence_level = "MEDIUM"
-
-            # Emit complete metrics
-            yield {
-                'type': 'metrics_complete',
-                'metrics': {
-                    'match_score': int(result.get("match_score", 50)),
-                    'skills_match_score': skills_match_score,
-                    'experience_match_score': experience_match_score,
-                    'education_match_score': education_match_score,
-                    'culture_fit_score': culture_fit_score,
-                    'location_match_score': location_match_score,
-                    'salary_match_score': salary_match_score,
-                    'technical_skills_score': technical_skills_score,
-                    'soft_skills_score': soft_skills_score,
-                    'domain_knowledge_score': domain_knowledge_score,
-                    'readiness_percentage': readiness_percentage,
-                    'eligibility_level': result.get("eligibility_level", "FAIR"),
-                },
-                'progress': 95
-            }
+            yield _status_event('processing', 'Processing analysis results...', 90)
+
+            accumulated_content = stream_buffer.content
+            fields = self._build_analysis_fields(self._parse_final_result(accumulated_content))
+
+            yield self._metrics_complete_event(fields)
 
             # Step 5: Save to database
-            analysis = JobEligibilityAnalysis.objects.create(
-                user=user,
-                job=job,
-                additional_context=additional_context,
-                eligibility_level=result.get("eligibility_level", "FAIR"),
-                match_score=int(result.get("match_score", 50)),
-                analysis_summary=result.get("analysis_summary", ""),
-                strengths=ensure_list(result.get("strengths", [])),
-                gaps=ensure_list(result.get("gaps", [])),
-                recommendations=ensure_list(result.get("recommendations", [])),
-                matching_skills=ensure_list(result.get("matching_skills", [])),
-                missing_skills=ensure_list(result.get("missing_skills", [])),
-                skill_gaps=ensure_list(result.get("skill_gaps", [])),
-                skills_match_score=skills_match_score,
-                experience_match_score=experience_match_score,
-                education_match_score=education_match_score,
-                culture_fit_score=culture_fit_score,
-                location_match_score=location_match_score,
-                salary_match_score=salary_match_score,
-                technical_skills_score=technical_skills_score,
-                soft_skills_score=soft_skills_score,
-                domain_knowledge_score=domain_knowledge_score,
-                experience_match=result.get("experience_match", ""),
-                experience_gap_years=exp_gap,
-                years_of_experience_required=years_required,
-                years_of_experience_user=years_user,
-                readiness_percentage=readiness_percentage,
-                estimated_preparation_time=result.get("estimated_preparation_time", ""),
-                confidence_level=confidence_level,
-                next_steps=ensure_list(result.get("next_steps", [])),
-                priority_improvements=ensure_list(result.get("priority_improvements", [])),
-                learning_resources=ensure_list(result.get("learning_resources", [])),
-                interview_questions=ensure_list(result.get("interview_questions", [])),
-                full_analysis=accumulated_content,
-                llm_model=self.model_name,
-                token_usage=0,
+            analysis = self._save_analysis(
+                user, job, additional_context, fields, accumulated_content
             )
 
             # Step 6: Emit completion
-            yield {
-                'type': 'complete',
-                'analysis_id': analysis.id,
-                'message': 'Analysis complete!',
-                'progress': 100
-            }
+            yield self._complete_event(analysis)
 
             return analysis
 
         except Exception as e:
-            yield {
-                'type': 'error',
-                'error': str(e),
-                'message': f'Analysis failed: {str(e)}'
-            }
+            yield self._error_event(e)
+            raise
+
+    async def astream_analyze_eligibility(
+        self,
+        user: User,
+        job: Job,
+        additional_context: str = ""
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Async variant of stream_analyze_eligibility
+
+        The LLM is consumed with astream() and ORM work runs through
+        sync_to_async, so the event loop is free to serve other requests
+        while waiting on the model or the database.
+
+        Args:
+            user: User to analyze
+            job: Job to analyze for
+            additional_context: Additional context provided by user
+
+        Yields:
+            The same progress events as stream_analyze_eligibility
+        """
+        # Step 1: Gather context
+        yield _status_event('gathering_context', 'Gathering your profile information...', 10)
+
+        user_context = await sync_to_async(self._get_user_context)(user)
+        job_context = await sync_to_async(self._get_job_context)(job)
+
+        yield self._context_gathered_event(user_context)
+
+        # Step 2: Create prompt
+        yield _status_event('analyzing', 'AI is analyzing your fit for this role...', 30)
+
+        prompt = self._create_prompt(user_context, job_context, additional_context)
+
+        try:
+            # Step 3: Stream LLM response
+            stream_buffer = _StreamBuffer(self)
+            async for chunk in self.llm.astream(prompt):
+                for event in stream_buffer.feed(chunk):
+                    yield event
+            for event in stream_buffer.flush():
+                yield event
+
+            # Step 4: Process complete response
+            yield _status_event('processing', 'Processing analysis results...', 90)
+
+            accumulated_content = stream_buffer.content
+            fields = self._build_analysis_fields(self._parse_final_result(accumulated_content))
+
+            yield self._metrics_complete_event(fields)
+
+            # Step 5: Save to database
+            analysis = await sync_to_async(self._save_analysis)(
+                user, job, additional_context, fields, accumulated_content
+            )
+
+            # Step 6: Emit completion
+            yield self._complete_event(analysis)
+
+        except Exception as e:
+            yield self._error_event(e)
             raise
 
+    async def astream_sse(
+        self,
+        user: User,
+        job: Job,
+        additional_context: str = ""
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Stream the analysis as Server-Sent Events with backpressure
+
+        Events from astream_analyze_eligibility go through a bounded queue.
+        When the client falls behind and the queue is full, 'partial_metric'
+        events are dropped (each one carries all metrics found so far) and
+        'partial_analysis' deltas are held back and merged into the next one,
+        so no text is lost. Every other event is always delivered.
+
+        Args:
+            user: User to analyze
+            job: Job to analyze for
+            additional_context: Additional context provided by user
+
+        Yields:
+            SSE-formatted event bytes
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.sse_queue_size)
+        done = object()
+        error: Optional[Exception] = None
+
+        async def producer():
+            nonlocal error
+            # Text delta that did not fit in the queue, merged into the next one
+            pending: Optional[Dict[str, Any]] = None
+            try:
+                async for event in self.astream_analyze_eligibility(
+                    user, job, additional_context
+                ):
+                    if event['type'] == 'partial_metric':
+                        if queue.full():
+                            continue
+                    elif event['type'] == 'partial_analysis':
+                        if pending is not None:
+                            event = {**event, 'content': pending['content'] + event['content']}
+                            pending = None
+                        if queue.full():
+                            pending = event
+                            continue
+                    elif pending is not None:
+                        await queue.put(pending)
+                        pending = None
+                    await queue.put(event)
+            except Exception as e:
+                # The error event has already been queued; re-raised below
+                error = e
+            await queue.put(done)
+
+        task = asyncio.create_task(producer())
+        try:
+            while True:
+                event = await queue.get()
+                if event is done:
+                    break
+                yield f"data: {json.dumps(event)}\n\n".encode()
+        finally:
+            task.cancel()
+
+        if error is not None:
+            raise error
+
+    def _parse_final_result(self, content: str) -> Dict[str, Any]:
+        """
+        Parse the complete LLM response into a result dictionary
+
+        Args:
+            content: Full LLM response
+
+        Returns:
+            Parsed JSON result, or a fallback result if parsing fails
+        """
+        # Work on bytes so orjson can parse the slice without re-encoding it
+        buf = content.encode()
+        start_idx = buf.find(b"{")
+        end_idx = buf.rfind(b"}")
+        try:
+            if start_idx != -1 and end_idx > start_idx:
+                return orjson.loads(buf[start_idx:end_idx + 1])
+        except orjson.JSONDecodeError:
+            pass
+
+        # Fallback when no valid JSON was returned
+        return {
+            "eligibility_level": "FAIR",
+            "match_score": 50,
+            "analysis_summary": f"Analysis could not be parsed properly.",
+            "strengths": [],
+            "gaps": [],
+            "recommendations": [],
+            "matching_skills": [],
+            "missing_skills": [],
+            "experience_match": "Unable to parse experience match",
+        }
+
+    def _build_analysis_fields(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a parsed LLM result into JobEligibilityAnalysis field values
+
+        Args:
+            result: Parsed LLM result
+
+        Returns:
+            Dictionary of model field values
+        """
+        return {
+            name: coerce(result.get(name), default)
+            for name, coerce, default in ANALYSIS_FIELD_SCHEMA
+        }
+
+    def _save_analysis(
+        self,
+        user: User,
+        job: Job,
+        additional_context: str,
+        fields: Dict[str, Any],
+        full_analysis: str,
+    ) -> JobEligibilityAnalysis:
+        """Persist a completed streaming analysis"""
+        return JobEligibilityAnalysis.objects.create(
+            user=user,
+            job=job,
+            additional_context=additional_context,
+            full_analysis=full_analysis,
+            llm_model=self.model_name,
+            token_usage=0,
+            **fields,
+        )
+
+    def _context_gathered_event(self, user_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the status event summarizing the gathered user context"""
+        return _status_event(
+            'context_gathered',
+            f'Analyzed {len(user_context.get("skills", []))} skills and {len(user_context.get("work_experience", []))} work experiences',
+            20,
+        )
+
+    def _metrics_complete_event(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the 'metrics_complete' event from analysis field values"""
+        return {
+            'type': 'metrics_complete',
+            'metrics': {name: fields[name] for name in METRIC_FIELDS},
+            'progress': 95
+        }
+
+    def _complete_event(self, analysis: JobEligibilityAnalysis) -> Dict[str, Any]:
+        """Build the final 'complete' event"""
+        return {
+            'type': 'complete',
+            'analysis_id': analysis.id,
+            'message': 'Analysis complete!',
+            'progress': 100
+        }
+
+    def _error_event(self, error: Exception) -> Dict[str, Any]:
+        """Build an 'error' event"""
+        return {
+            'type': 'error',
+            'error': str(error),
+            'message': f'Analysis failed: {str(error)}'
+        }
+
     def _extract_partial_metrics(self, content: str) -> Optional[Dict[str, int]]:
         """
         Extract partial metrics from incomplete JSON response
@@ -276,25 +567,12 @@ class StreamingJobAnalyzer(JobEligibilityAnalyzer):
         Returns:
             Dictionary of metrics if found, None otherwise
         """
-        try:
-            # Try to find and parse score fields
-            metrics = {}
-            score_fields = [
-                'match_score',
-                'skills_match_score',
-                'experience_match_score',
-                'technical_skills_score',
-                'readiness_percentage'
-            ]
-
-            for field in score_fields:
-                # Look for patterns like "field_name": 85
-                import re
-                pattern = f'"{field}"\\s*:\\s*(\\d+)'
-                match = re.search(pattern, content)
-                if match:
-                    metrics[field] = int(match.group(1))
-
-            return metrics if metrics else None
-        except:
-            return None
+        metrics = {}
+        for match in _PARTIAL_METRICS_RE.finditer(content):
+            # A number at the very end may still be growing in the next chunk
+            if match.end() == len(content):
+                continue
+            # Keep the first occurrence of each field
+            metrics.setdefault(match.group(1), int(match.group(2)))
+
+        return metrics or None
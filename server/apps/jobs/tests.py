@@ -1,3 +1,212 @@
+import asyncio
+import json
+import os
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from langchain_core.messages import AIMessageChunk
+
+from apps.profiles.models import (
+    Certification,
+    Education,
+    Skill,
+    UserProfile,
+    UserSkill,
+    WorkExperience,
+)
+from apps.users.models import User, UserPreference
+
+from .models import Job, JobEligibilityAnalysis, JobSkillRequirement
+from .services import job_context_cache_key, user_context_cache_key
+from .streaming_services import StreamingJobAnalyzer
+
+
+class FakeStreamingLLM:
+    """Stands in for the chat model: astream() yields fixed text chunks"""
+
+    def __init__(self, chunks, error_after=None):
+        self.chunks = chunks
+        self.error_after = error_after
+
+    async def astream(self, prompt):
+        for i, chunk in enumerate(self.chunks):
+            if i == self.error_after:
+                raise RuntimeError("LLM connection lost")
+            yield AIMessageChunk(content=chunk)
+
+
+def make_job(**kwargs):
+    defaults = {
+        "title": "Backend Engineer",
+        "company_name": "Acme",
+        "company_description": "Builds things",
+        "description": "Build APIs",
+        "location": "Remote",
+        "source_url": "https://example.com/jobs/1",
+    }
+    defaults.update(kwargs)
+    return Job.objects.create(**defaults)
+
+
+class AstreamSSETests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="streamer", email="streamer@example.com", password="pass"
+        )
+        self.job = make_job()
+
+        with mock.patch.dict(os.environ, {"MODEL_PROVIDER": "", "OPENAI_API_KEY": "test"}):
+            self.analyzer = StreamingJobAnalyzer()
+        self.analyzer.sse_queue_size = 2
+        # Flush on every chunk so plenty of partial events compete for the queue
+        self.analyzer.batch_growth = 1
+        self.analyzer.flush_interval = 60
+
+        body = json.dumps({
+            "eligibility_level": "GOOD",
+            "match_score": 81,
+            "skills_match_score": 77,
+            "analysis_summary": "Strong backend fit. " * 40,
+        })
+        self.content = body
+        self.chunks = [body[i:i + 4] for i in range(0, len(body), 4)]
+
+    async def consume(self, stream):
+        """Read the SSE stream slowly, like a client on a bad connection"""
+        events = []
+        async for payload in stream:
+            events.append(json.loads(payload.decode()[len("data: "):]))
+            await asyncio.sleep(0.001)
+        return events
+
+    async def produced_events(self):
+        """Events the analysis emits with no queue in between"""
+        return [
+            event
+            async for event in self.analyzer.astream_analyze_eligibility(self.user, self.job)
+        ]
+
+    async def test_text_survives_a_full_queue(self):
+        self.analyzer.llm = FakeStreamingLLM(self.chunks)
+
+        events = await self.consume(self.analyzer.astream_sse(self.user, self.job))
+
+        text = "".join(e["content"] for e in events if e["type"] == "partial_analysis")
+        self.assertEqual(text, self.content)
+        self.assertEqual(events[-1]["type"], "complete")
+        analysis = await JobEligibilityAnalysis.objects.aget(pk=events[-1]["analysis_id"])
+        self.assertEqual(analysis.full_analysis, self.content)
+
+    async def test_only_partial_metrics_are_dropped(self):
+        self.analyzer.llm = FakeStreamingLLM(self.chunks)
+        produced = await self.produced_events()
+
+        self.analyzer.llm = FakeStreamingLLM(self.chunks)
+        delivered = await self.consume(self.analyzer.astream_sse(self.user, self.job))
+
+        def count(events, event_type):
+            return sum(1 for e in events if e["type"] == event_type)
+
+        self.assertLess(count(delivered, "partial_metric"), count(produced, "partial_metric"))
+        for event_type in ("status", "metrics_complete", "complete"):
+            self.assertEqual(count(delivered, event_type), count(produced, event_type))
+        # Undelivered deltas are merged, never dropped
+        self.assertLessEqual(count(delivered, "partial_analysis"), count(produced, "partial_analysis"))
+        self.assertEqual(
+            [e["type"] for e in delivered if e["type"] not in ("partial_metric", "partial_analysis")],
+            [e["type"] for e in produced if e["type"] not in ("partial_metric", "partial_analysis")],
+        )
+
+    async def test_error_event_is_followed_by_reraise(self):
+        self.analyzer.llm = FakeStreamingLLM(self.chunks, error_after=10)
+        events = []
+
+        with self.assertRaisesMessage(RuntimeError, "LLM connection lost"):
+            async for payload in self.analyzer.astream_sse(self.user, self.job):
+                events.append(json.loads(payload.decode()[len("data: "):]))
+
+        self.assertEqual(events[-1]["type"], "error")
+        self.assertEqual(events[-1]["error"], "LLM connection lost")
+        text = "".join(e["content"] for e in events if e["type"] == "partial_analysis")
+        self.assertEqual(text, "".join(self.chunks[:10]))
+
+
+class ContextCacheInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="cached", email="cached@example.com", password="pass"
+        )
+        self.profile = UserProfile.objects.create(user=self.user)
+        self.skill = Skill.objects.create(name="Python")
+        self.job = make_job()
+        self.user_key = user_context_cache_key(self.user.id)
+        self.job_key = job_context_cache_key(self.job.id)
+
+    def assertInvalidates(self, key, write):
+        """Run write() with a cached context in place and check it was dropped"""
+        cache.set(key, {"stale": True})
+        with self.captureOnCommitCallbacks(execute=True):
+            write()
+        self.assertIsNone(cache.get(key))
+
+    def test_user_save_and_delete(self):
+        self.assertInvalidates(self.user_key, lambda: self.user.save())
+        self.assertInvalidates(self.user_key, lambda: self.user.delete())
+
+    def test_profile_and_preferences_save_and_delete(self):
+        self.assertInvalidates(self.user_key, lambda: self.profile.save())
+        prefs = UserPreference(user=self.user)
+        self.assertInvalidates(self.user_key, lambda: prefs.save())
+        self.assertInvalidates(self.user_key, lambda: prefs.delete())
+        self.assertInvalidates(self.user_key, lambda: self.profile.delete())
+
+    def test_profile_records_save_and_delete(self):
+        records = [
+            UserSkill(profile=self.profile, skill=self.skill),
+            WorkExperience(
+                profile=self.profile, job_title="Engineer", company="Acme",
+                start_date="2020-01-01",
+            ),
+            Education(
+                profile=self.profile, institution="State", degree="BSc",
+                degree_level="BACHELOR", start_date="2015-09-01",
+            ),
+            Certification(
+                profile=self.profile, name="Cloud", issuing_organization="Vendor",
+                issue_date="2021-05-01",
+            ),
+        ]
+        for record in records:
+            with self.subTest(model=type(record).__name__):
+                self.assertInvalidates(self.user_key, lambda: record.save())
+                self.assertInvalidates(self.user_key, lambda: record.delete())
+
+    def test_skill_links_changed(self):
+        work = WorkExperience.objects.create(
+            profile=self.profile, job_title="Engineer", company="Acme",
+            start_date="2020-01-01",
+        )
+        cert = Certification.objects.create(
+            profile=self.profile, name="Cloud", issuing_organization="Vendor",
+            issue_date="2021-05-01",
+        )
+        self.assertInvalidates(self.user_key, lambda: work.skills_used.add(self.skill))
+        self.assertInvalidates(self.user_key, lambda: work.skills_used.remove(self.skill))
+        self.assertInvalidates(self.user_key, lambda: cert.skills_validated.add(self.skill))
+        self.assertInvalidates(self.user_key, lambda: cert.skills_validated.clear())
+
+    def test_job_and_requirements_save_and_delete(self):
+        self.assertInvalidates(self.job_key, lambda: self.job.save())
+        requirement = JobSkillRequirement(job=self.job, skill=self.skill)
+        self.assertInvalidates(self.job_key, lambda: requirement.save())
+        self.assertInvalidates(self.job_key, lambda: requirement.delete())
+        self.assertInvalidates(self.job_key, lambda: self.job.delete())
 
-# Create your tests here.
+    def test_unrelated_writes_keep_the_cache(self):
+        cache.set(self.user_key, {"cached": True})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+        self.assertEqual(cache.get(self.user_key), {"cached": True})
@@ -2,7 +2,7 @@
 URL Configuration for jobs app
 """
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import (
     JobViewSet,
@@ -11,15 +11,11 @@ from .views import (
 
 app_name = 'jobs'
 
-# Create separate routers to avoid URL pattern conflicts
-jobs_router = DefaultRouter()
-jobs_router.register(r'', JobViewSet, basename='job')
-
-analyses_router = DefaultRouter()
-analyses_router.register(r'', JobEligibilityAnalysisViewSet, basename='analysis')
+router = SimpleRouter()
+# Analyses must be registered BEFORE jobs so 'analyses/' is not matched as a job pk
+router.register(r'analyses', JobEligibilityAnalysisViewSet, basename='analysis')
+router.register(r'', JobViewSet, basename='job')
 
 urlpatterns = [
-    # Analyses must come BEFORE jobs to avoid pattern matching conflicts
-    path('analyses/', include(analyses_router.urls)),
-    path('', include(jobs_router.urls)),
+    path('', include(router.urls)),
 ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userskill',
+            index=models.Index(fields=['profile', '-proficiency_level', '-years_of_experience'], name='user_skills_profile_47c11c_idx'),
+        ),
+    ]
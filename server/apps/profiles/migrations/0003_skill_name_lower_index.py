@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-15 09:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0002_userskill_profile_proficiency_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='skills_name_lower_idx'),
+        ),
+    ]
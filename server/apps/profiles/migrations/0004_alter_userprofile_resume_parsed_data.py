@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+def empty_to_null(apps, schema_editor):
+    UserProfile = apps.get_model('profiles', 'UserProfile')
+    UserProfile.objects.filter(resume_parsed_data={}).update(resume_parsed_data=None)
+
+
+def null_to_empty(apps, schema_editor):
+    UserProfile = apps.get_model('profiles', 'UserProfile')
+    UserProfile.objects.filter(resume_parsed_data__isnull=True).update(resume_parsed_data={})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0003_skill_name_lower_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='resume_parsed_data',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.RunPython(empty_to_null, null_to_empty),
+    ]
@@ -3,6 +3,7 @@ Profile models for SkillSetz platform
 """
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 from apps.users.models import User
 
@@ -29,7 +30,7 @@ class UserProfile(models.Model):
     # Documents
     resume = models.FileField(upload_to="resumes/", null=True, blank=True)
     resume_text = models.TextField(blank=True)  # Extracted text from resume
-    resume_parsed_data = models.JSONField(default=dict, blank=True)
+    resume_parsed_data = models.JSONField(null=True, blank=True)  # NULL until a resume is parsed
 
     # Career Goals
     career_goal = models.TextField(blank=True)
@@ -288,6 +289,10 @@ class Skill(models.Model):
         verbose_name = _("Skill")
         verbose_name_plural = _("Skills")
         ordering = ["name"]
+        indexes = [
+            # Case-insensitive lookups filtering on Lower("name")
+            models.Index(Lower("name"), name="skills_name_lower_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -331,6 +336,9 @@ class UserSkill(models.Model):
         verbose_name_plural = _("User Skills")
         unique_together = ["profile", "skill"]
         ordering = ["-proficiency_level", "-years_of_experience"]
+        indexes = [
+            models.Index(fields=["profile", "-proficiency_level", "-years_of_experience"]),
+        ]
 
     def __str__(self):
         return f"{self.skill.name} ({self.proficiency_level})"
@@ -119,6 +119,13 @@ class UserProfileSerializer(serializers.ModelSerializer):
     def get_user_name(self, obj):
         return f"{obj.user.first_name} {obj.user.last_name}".strip() or obj.user.username
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Keep the API shape stable for profiles without a parsed resume
+        if data.get('resume_parsed_data') is None:
+            data['resume_parsed_data'] = {}
+        return data
+
 
 class EducationSerializer(serializers.ModelSerializer):
     """
@@ -284,6 +284,9 @@ class ProfileBuilderService:
         self.user = user
         self.parsed_data = parsed_data
 
+        # Skills referenced by the parsed data, keyed by lowercase name
+        self._skills_by_name = None
+
     def create_or_update_profile(self, resume_file=None, resume_text: str = None) -> Any:
         """
         Create or update user profile from parsed resume data
@@ -374,6 +377,113 @@ class ProfileBuilderService:
         # Default fallback
         return date_str
 
+    def _load_skills(self):
+        """
+        Load every skill referenced in the parsed data, creating missing ones
+
+        Existing skills are fetched with a single query and any missing skills
+        are inserted with a single bulk_create.
+        """
+        from django.db.models.functions import Lower
+        from apps.profiles.models import Skill, SkillCategory
+
+        # Mark the preload as done up front so a failure is not retried per skill;
+        # _get_skill falls back to single lookups for anything not loaded
+        self._skills_by_name = {}
+
+        # Lowercase name -> (name, skill type), in the order records are created
+        needed = {}
+        for section, field in (
+            ("work_experience", "skills_used"),
+            ("projects", "skills_demonstrated"),
+            ("certifications", "skills_validated"),
+        ):
+            for item in self.parsed_data.get(section) or []:
+                if not isinstance(item, dict):
+                    continue
+                names = item.get(field)
+                if not isinstance(names, list):
+                    continue
+                for name in names:
+                    if isinstance(name, str) and name.strip():
+                        needed.setdefault(name.strip().lower(), (name.strip(), "TECHNICAL"))
+        for skill_data in self.parsed_data.get("skills") or []:
+            if not isinstance(skill_data, dict):
+                continue
+            name = skill_data.get("name", "")
+            if isinstance(name, str) and name.strip():
+                name = name.strip()
+                needed.setdefault(
+                    name.lower(), (name, skill_data.get("category", "TECHNICAL"))
+                )
+
+        def fetch(lowered_names):
+            return {
+                skill.name.lower(): skill
+                for skill in Skill.objects.annotate(name_lower=Lower("name")).filter(
+                    name_lower__in=lowered_names
+                )
+            }
+
+        self._skills_by_name = fetch(needed.keys())
+
+        missing = [key for key in needed if key not in self._skills_by_name]
+        if missing:
+            default_category, _ = SkillCategory.objects.get_or_create(
+                name="General",
+                defaults={"description": "General skills"},
+            )
+            Skill.objects.bulk_create(
+                [
+                    Skill(
+                        name=needed[key][0],
+                        category=default_category,
+                        skill_type=needed[key][1],
+                    )
+                    for key in missing
+                ],
+                ignore_conflicts=True,
+            )
+            self._skills_by_name.update(fetch(missing))
+
+    def _get_skill(self, skill_name: str, default_category, skill_type: str = "TECHNICAL"):
+        """
+        Get a skill by case-insensitive name, creating it if needed
+
+        Args:
+            skill_name: Skill name (already stripped)
+            default_category: SkillCategory for newly created skills
+            skill_type: Skill type for newly created skills
+
+        Returns:
+            Skill instance
+        """
+        from django.db.models.functions import Lower
+        from apps.profiles.models import Skill
+
+        if self._skills_by_name is None:
+            self._load_skills()
+
+        key = skill_name.lower()
+        skill = self._skills_by_name.get(key)
+        if skill is None:
+            # Match on Lower("name") so the lookup uses skills_name_lower_idx
+            skill = (
+                Skill.objects.annotate(name_lower=Lower("name"))
+                .filter(name_lower=key)
+                .first()
+            )
+            if skill is None:
+                skill, _ = Skill.objects.get_or_create(
+                    name=skill_name,
+                    defaults={
+                        "category": default_category,
+                        "skill_type": skill_type,
+                    },
+                )
+            self._skills_by_name[key] = skill
+        return skill
+
     def create_education_records(self, profile) -> list:
         """
         Create education records from parsed data
@@ -418,7 +528,7 @@ class ProfileBuilderService:
         Returns:
             List of created WorkExperience instances
         """
-        from apps.profiles.models import WorkExperience, Skill, SkillCategory
+        from apps.profiles.models import WorkExperience, SkillCategory
 
         work_records = []
 
@@ -454,14 +564,7 @@ class ProfileBuilderService:
                 skills_used = work_data.get("skills_used", [])
                 for skill_name in skills_used:
                     if skill_name:
-                        skill, _ = Skill.objects.get_or_create(
-                            name__iexact=skill_name.strip(),
-                            defaults={
-                                "name": skill_name.strip(),
-                                "category": default_category,
-                                "skill_type": "TECHNICAL",
-                            },
-                        )
+                        skill = self._get_skill(skill_name.strip(), default_category)
                         work_exp.skills_used.add(skill)
 
                 work_records.append(work_exp)
@@ -481,7 +584,7 @@ class ProfileBuilderService:
         Returns:
             List of created Project instances
         """
-        from apps.profiles.models import Project, Skill, SkillCategory
+        from apps.profiles.models import Project, SkillCategory
 
         projects = []
 
@@ -523,14 +626,7 @@ class ProfileBuilderService:
                 skills_demonstrated = proj_data.get("skills_demonstrated", [])
                 for skill_name in skills_demonstrated:
                     if skill_name:
-                        skill, _ = Skill.objects.get_or_create(
-                            name__iexact=skill_name.strip(),
-                            defaults={
-                                "name": skill_name.strip(),
-                                "category": default_category,
-                                "skill_type": "TECHNICAL",
-                            },
-                        )
+                        skill = self._get_skill(skill_name.strip(), default_category)
                         project.skills_demonstrated.add(skill)
 
                 projects.append(project)
@@ -550,7 +646,7 @@ class ProfileBuilderService:
         Returns:
             List of created Certification instances
         """
-        from apps.profiles.models import Certification, Skill, SkillCategory
+        from apps.profiles.models import Certification, SkillCategory
 
         certifications = []
 
@@ -577,14 +673,7 @@ class ProfileBuilderService:
                 skills_validated = cert_data.get("skills_validated", [])
                 for skill_name in skills_validated:
                     if skill_name:
-                        skill, _ = Skill.objects.get_or_create(
-                            name__iexact=skill_name.strip(),
-                            defaults={
-                                "name": skill_name.strip(),
-                                "category": default_category,
-                                "skill_type": "TECHNICAL",
-                            },
-                        )
+                        skill = self._get_skill(skill_name.strip(), default_category)
                         certification.skills_validated.add(skill)
 
                 certifications.append(certification)
@@ -604,7 +693,7 @@ class ProfileBuilderService:
         Returns:
             List of created UserSkill instances
         """
-        from apps.profiles.models import Skill, UserSkill, SkillCategory
+        from apps.profiles.models import UserSkill, SkillCategory
 
         user_skills = []
 
@@ -614,6 +703,12 @@ class ProfileBuilderService:
             defaults={"description": "General skills"},
         )
 
+        # Load the profile's existing skills once instead of looking each one up
+        existing_user_skills = {
+            user_skill.skill_id: user_skill
+            for user_skill in UserSkill.objects.filter(profile=profile)
+        }
+
         for skill_data in self.parsed_data.get("skills", []):
             try:
                 skill_name = skill_data.get("name", "").strip()
@@ -621,24 +716,25 @@ class ProfileBuilderService:
                     continue
 
                 # Get or create skill
-                skill, _ = Skill.objects.get_or_create(
-                    name__iexact=skill_name,
-                    defaults={
-                        "name": skill_name,
-                        "category": default_category,
-                        "skill_type": skill_data.get("category", "TECHNICAL"),
-                    },
+                skill = self._get_skill(
+                    skill_name, default_category, skill_data.get("category", "TECHNICAL")
                 )
 
                 # Create or update user skill
-                user_skill, _ = UserSkill.objects.update_or_create(
-                    profile=profile,
-                    skill=skill,
-                    defaults={
-                        "proficiency_level": skill_data.get("proficiency", "INTERMEDIATE"),
-                        "years_of_experience": skill_data.get("years_of_experience", 0),
-                    },
-                )
+                defaults = {
+                    "proficiency_level": skill_data.get("proficiency", "INTERMEDIATE"),
+                    "years_of_experience": skill_data.get("years_of_experience", 0),
+                }
+                user_skill = existing_user_skills.get(skill.id)
+                if user_skill is None:
+                    user_skill = UserSkill.objects.create(
+                        profile=profile, skill=skill, **defaults
+                    )
+                    existing_user_skills[skill.id] = user_skill
+                else:
+                    for field, value in defaults.items():
+                        setattr(user_skill, field, value)
+                    user_skill.save(update_fields=[*defaults, "updated_at"])
                 user_skills.append(user_skill)
 
             except Exception as e:
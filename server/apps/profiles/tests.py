@@ -1,3 +1,52 @@
 from django.test import TestCase
 
-# Create your tests here.
+from apps.users.models import User
+
+from .models import UserProfile
+from .services import ProfileBuilderService
+
+
+class ProfileBuilderServiceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="builder", email="builder@example.com", password="pass"
+        )
+        self.profile = UserProfile.objects.create(user=self.user)
+
+    def test_malformed_entries_do_not_break_skill_preload(self):
+        parsed_data = {
+            "skills": [{"name": "Python"}, "Rust"],
+            "work_experience": [
+                {
+                    "job_title": "Engineer",
+                    "company": "Acme",
+                    "start_date": "2020-01",
+                    "skills_used": ["Python", "Django"],
+                },
+                "not a record",
+            ],
+            "projects": [
+                {
+                    "title": "Tool",
+                    "description": "A tool",
+                    "skills_demonstrated": ["Python"],
+                },
+            ],
+        }
+        builder = ProfileBuilderService(self.user, parsed_data)
+
+        work_records = builder.create_work_experience_records(self.profile)
+        projects = builder.create_project_records(self.profile)
+        user_skills = builder.create_user_skills(self.profile)
+
+        self.assertEqual(len(work_records), 1)
+        self.assertEqual(
+            sorted(work_records[0].skills_used.values_list("name", flat=True)),
+            ["Django", "Python"],
+        )
+        self.assertEqual(len(projects), 1)
+        self.assertEqual(
+            list(projects[0].skills_demonstrated.values_list("name", flat=True)),
+            ["Python"],
+        )
+        self.assertEqual([us.skill.name for us in user_skills], ["Python"])
@@ -5,6 +5,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.db.models import Prefetch, prefetch_related_objects
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
@@ -14,6 +15,7 @@ from .models import (
     WorkExperience,
     Project,
     Certification,
+    UserSkill,
 )
 from .serializers import (
     UserProfileSerializer,
@@ -72,6 +74,17 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         Get complete profile with all related data
         """
         profile, created = UserProfile.objects.get_or_create(user=request.user)
+        prefetch_related_objects(
+            [profile],
+            'education_records',
+            'work_experiences__skills_used',
+            'projects__skills_demonstrated',
+            'certifications__skills_validated',
+            Prefetch(
+                'user_skills',
+                queryset=UserSkill.objects.select_related('skill__category'),
+            ),
+        )
         serializer = CompleteProfileSerializer(profile)
         return Response(serializer.data)
 